@@ -18,15 +18,15 @@ def calculate_fapar(ndvi):
     Formula: fAPARg = 0.013 * e^(4.48 * NDVI)
     
     Args:
-        ndvi: NDVI value (0-1 range)
+        ndvi: NDVI value (0-1 range), or a NumPy array of values
         
     Returns:
-        fAPARg value
+        fAPARg value (an array of values for array input; NaN where NDVI is missing)
     """
-    if pd.isna(ndvi):
+    if np.ndim(ndvi) == 0 and pd.isna(ndvi):
         return np.nan
     
-    fapar = 0.013 * np.exp(4.48 * ndvi)
+    fapar = 0.013 * np.exp(4.48 * np.asarray(ndvi, dtype=float))
     return fapar
 
 
@@ -137,19 +137,16 @@ def print_summary_statistics(df):
     print("SUMMARY STATISTICS")
     print("=" * 80)
     
-    print("\nNDVI Statistics:")
-    print("─" * 80)
-    print(f"  Mean: {df['NDVI Mean'].mean():.4f}")
-    print(f"  Std:  {df['NDVI Mean'].std():.4f}")
-    print(f"  Min:  {df['NDVI Mean'].min():.4f}")
-    print(f"  Max:  {df['NDVI Mean'].max():.4f}")
+    # One aggregation call for both columns instead of eight separate reductions
+    stats = df[['NDVI Mean', 'fAPARg Mean']].agg(['mean', 'std', 'min', 'max'])
     
-    print("\nfAPARg Statistics:")
-    print("─" * 80)
-    print(f"  Mean: {df['fAPARg Mean'].mean():.4f}")
-    print(f"  Std:  {df['fAPARg Mean'].std():.4f}")
-    print(f"  Min:  {df['fAPARg Mean'].min():.4f}")
-    print(f"  Max:  {df['fAPARg Mean'].max():.4f}")
+    for label, column in (("NDVI", 'NDVI Mean'), ("fAPARg", 'fAPARg Mean')):
+        print(f"\n{label} Statistics:")
+        print("─" * 80)
+        print(f"  Mean: {stats.at['mean', column]:.4f}")
+        print(f"  Std:  {stats.at['std', column]:.4f}")
+        print(f"  Min:  {stats.at['min', column]:.4f}")
+        print(f"  Max:  {stats.at['max', column]:.4f}")
     
     print("\n" + "─" * 80)
     print("NDVI to fAPARg Conversion Examples:")
@@ -188,11 +185,15 @@ def print_summary_statistics(df):
     
     print(f"{'Field Name':30} {'Peak fAPARg':12} {'Peak NDVI':12} {'Days':6}")
     print("─" * 80)
-    for field_name, row in top_fields.iterrows():
-        print(f"{field_name[:30]:30} "
-              f"{row[('fAPARg Mean', 'max')]:12.4f} "
-              f"{row[('NDVI Mean', 'max')]:12.4f} "
-              f"{row[('Days Since Sowing', 'max')]:6.0f}")
+    print("\n".join(
+        f"{field_name[:30]:30} {peak_fapar:12.4f} {peak_ndvi:12.4f} {days:6.0f}"
+        for field_name, peak_fapar, peak_ndvi, days in zip(
+            top_fields.index,
+            top_fields[('fAPARg Mean', 'max')],
+            top_fields[('NDVI Mean', 'max')],
+            top_fields[('Days Since Sowing', 'max')]
+        )
+    ))
     
     # Variety comparison
     print("\n" + "─" * 80)
@@ -207,11 +208,15 @@ def print_summary_statistics(df):
     
     print(f"{'Variety':20} {'Avg fAPARg':12} {'Peak fAPARg':12} {'Obs':6}")
     print("─" * 80)
-    for variety, row in variety_stats.iterrows():
-        print(f"{variety[:20]:20} "
-              f"{row[('fAPARg Mean', 'mean')]:12.4f} "
-              f"{row[('fAPARg Mean', 'max')]:12.4f} "
-              f"{row[('fAPARg Mean', 'count')]:6.0f}")
+    print("\n".join(
+        f"{variety[:20]:20} {avg_fapar:12.4f} {peak_fapar:12.4f} {count:6.0f}"
+        for variety, avg_fapar, peak_fapar, count in zip(
+            variety_stats.index,
+            variety_stats[('fAPARg Mean', 'mean')],
+            variety_stats[('fAPARg Mean', 'max')],
+            variety_stats[('fAPARg Mean', 'count')]
+        )
+    ))
 
 
 def analyze_fapar_trends(df):
@@ -229,11 +234,14 @@ def analyze_fapar_trends(df):
         print(f"{'Date':12} {'Days':6} {'NDVI':8} {'fAPARg':10} {'Growth Stage':20}")
         print("─" * 80)
         
-        for _, row in sample.iterrows():
-            days = row['Days Since Sowing']
-            ndvi = row['NDVI Mean']
-            fapar = row['fAPARg Mean']
-            
+        # Collect the table and print it in one call instead of once per row
+        lines = []
+        for period_start, days, ndvi, fapar in zip(
+            sample['Period Start'],
+            sample['Days Since Sowing'],
+            sample['NDVI Mean'],
+            sample['fAPARg Mean']
+        ):
             # Estimate growth stage from days
             if days < 20:
                 stage = "Emergence"
@@ -248,8 +256,10 @@ def analyze_fapar_trends(df):
             else:
                 stage = "Maturity"
             
-            print(f"{row['Period Start']:12} {days:6.0f} "
-                  f"{ndvi:8.3f} {fapar:10.4f} {stage:20}")
+            lines.append(f"{period_start:12} {days:6.0f} "
+                         f"{ndvi:8.3f} {fapar:10.4f} {stage:20}")
+        
+        print("\n".join(lines))
         
         # Calculate cumulative fAPARg (proxy for total photosynthesis)
         cumulative_fapar = sample['fAPARg Mean'].sum()
@@ -9,12 +9,38 @@ PAR is approximately 45% of total solar radiation.
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List
 import time
 
 
+@lru_cache(maxsize=None)
+def get_weather_session() -> requests.Session:
+    """
+    Return the HTTP session shared by all Open-Meteo requests (created on first use).
+    
+    The session keeps connections alive, asks for gzip-compressed responses and
+    retries transient 429/5xx answers with exponential backoff. The CLI reuses
+    it too, so there is one connection pool and one retry policy.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    session.mount('https://', HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+    return session
+
+
 def fetch_solar_radiation_data(
     latitude: float,
     longitude: float,
@@ -45,33 +71,27 @@ def fetch_solar_radiation_data(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = get_weather_session().get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
         
-        # Parse the response
-        radiation_records = []
+        # Parse the response (missing days come back as null -> NaN)
         daily = data.get('daily', {})
         dates = daily.get('time', [])
-        radiation_list = daily.get('shortwave_radiation_sum', [])
+        total_radiation = np.array(daily.get('shortwave_radiation_sum', []), dtype=float)
         
-        for i, date in enumerate(dates):
-            # Convert from MJ/m² to usable format
-            total_radiation = radiation_list[i] if radiation_list[i] is not None else None
-            
-            # Calculate PAR (approximately 45% of total solar radiation)
-            if total_radiation is not None:
-                par = total_radiation * 0.45
-            else:
-                par = None
-            
-            radiation_records.append({
-                'date': date,
-                'total_radiation_MJ': total_radiation,  # Total solar radiation (MJ/m²/day)
-                'PAR_MJ': par  # Photosynthetically Active Radiation (MJ/m²/day)
-            })
+        # Calculate PAR (approximately 45% of total solar radiation)
+        par = total_radiation * 0.45
+        missing = np.isnan(total_radiation)
         
-        return radiation_records
+        return [
+            {
+                'date': date,
+                'total_radiation_MJ': None if gap else rad,  # Total solar radiation (MJ/m²/day)
+                'PAR_MJ': None if gap else p  # Photosynthetically Active Radiation (MJ/m²/day)
+            }
+            for date, rad, p, gap in zip(dates, total_radiation.tolist(), par.tolist(), missing.tolist())
+        ]
         
     except requests.exceptions.RequestException as e:
         print(f"Error fetching solar radiation data: {e}")
@@ -136,22 +156,24 @@ def process_all_fields_radiation(geojson_path: str) -> Dict:
     
     print(f"✓ Fetched {len(radiation_data)} days of solar radiation data")
     
-    # Calculate statistics
-    valid_radiation = [r['total_radiation_MJ'] for r in radiation_data if r['total_radiation_MJ'] is not None]
-    valid_par = [r['PAR_MJ'] for r in radiation_data if r['PAR_MJ'] is not None]
+    # Calculate statistics (missing days become NaN and are dropped)
+    total_radiation = np.array([r['total_radiation_MJ'] for r in radiation_data], dtype=float)
+    par = np.array([r['PAR_MJ'] for r in radiation_data], dtype=float)
+    valid_radiation = total_radiation[~np.isnan(total_radiation)]
+    valid_par = par[~np.isnan(par)]
     
-    if valid_radiation:
+    if valid_radiation.size:
         print(f"\n{'─' * 80}")
         print("SOLAR RADIATION STATISTICS")
         print(f"{'─' * 80}")
         print(f"Total Radiation (MJ/m²/day):")
-        print(f"  Mean:   {sum(valid_radiation)/len(valid_radiation):.2f}")
-        print(f"  Min:    {min(valid_radiation):.2f}")
-        print(f"  Max:    {max(valid_radiation):.2f}")
+        print(f"  Mean:   {valid_radiation.mean():.2f}")
+        print(f"  Min:    {valid_radiation.min():.2f}")
+        print(f"  Max:    {valid_radiation.max():.2f}")
         print(f"\nPAR (MJ/m²/day):")
-        print(f"  Mean:   {sum(valid_par)/len(valid_par):.2f}")
-        print(f"  Min:    {min(valid_par):.2f}")
-        print(f"  Max:    {max(valid_par):.2f}")
+        print(f"  Mean:   {valid_par.mean():.2f}")
+        print(f"  Min:    {valid_par.min():.2f}")
+        print(f"  Max:    {valid_par.max():.2f}")
     
     # Create field-specific data
     results = {}
@@ -168,16 +190,15 @@ def process_all_fields_radiation(geojson_path: str) -> Dict:
         # Get coordinates for field (use center)
         geom = feature['geometry']
         coords = geom['coordinates'][0]
-        lats = [c[1] for c in coords]
-        lons = [c[0] for c in coords]
-        center_lat = sum(lats) / len(lats)
-        center_lon = sum(lons) / len(lons)
+        center_lon, center_lat = np.asarray(coords, dtype=float)[:, :2].mean(axis=0).tolist()
         
-        # Filter radiation data from sowing date onwards
-        sowing_dt = datetime.strptime(sowing_date, '%Y-%m-%d')
+        # Filter radiation data from sowing date onwards. The sowing date is parsed
+        # once and normalized to zero-padded ISO form (it may be written '2025-6-6');
+        # the API dates are already ISO strings, which sort chronologically.
+        sowing_iso = datetime.strptime(sowing_date, '%Y-%m-%d').strftime('%Y-%m-%d')
         field_radiation = [
-            r for r in radiation_data 
-            if datetime.strptime(r['date'], '%Y-%m-%d') >= sowing_dt
+            r for r in radiation_data
+            if r['date'] >= sowing_iso
         ]
         
         results[field_name] = {
@@ -193,7 +214,7 @@ def process_all_fields_radiation(geojson_path: str) -> Dict:
     return results
 
 
-def save_radiation_data(results: Dict, output_json: str, output_csv: str):
+def save_radiation_data(results: Dict, output_json: str, output_csv: str) -> pd.DataFrame:
     """
     Save radiation data to JSON and CSV files.
     
@@ -201,6 +222,9 @@ def save_radiation_data(results: Dict, output_json: str, output_csv: str):
         results: Dictionary with radiation data
         output_json: Path for JSON output
         output_csv: Path for CSV output
+        
+    Returns:
+        DataFrame with the rows written to the CSV
     """
     # Save JSON
     output_data = {
@@ -256,12 +280,12 @@ def save_radiation_data(results: Dict, output_json: str, output_csv: str):
     print(f"Fields: {df['Field Name'].nunique()}")
     print(f"Date range: {df['Date'].min()} to {df['Date'].max()}")
     print(f"Average PAR: {df['PAR (MJ/m²)'].mean():.2f} MJ/m²/day")
+    
+    return df
 
 
-def create_sample_analysis(csv_path: str):
-    """Create a sample analysis showing PAR data."""
-    df = pd.read_csv(csv_path)
-    
+def create_sample_analysis(df: pd.DataFrame):
+    """Create a sample analysis showing PAR data (from the DataFrame returned by save_radiation_data)."""
     print(f"\n{'=' * 80}")
     print("SAMPLE FIELD: DAILY PAR VALUES")
     print(f"{'=' * 80}")
@@ -285,9 +309,9 @@ def create_sample_analysis(csv_path: str):
     print("MONTHLY PAR AVERAGES")
     print(f"{'─' * 80}")
     
-    df['Date'] = pd.to_datetime(df['Date'])
-    df['Month'] = df['Date'].dt.strftime('%Y-%m')
-    monthly = df.groupby('Month')['PAR (MJ/m²)'].mean()
+    # Dates are ISO 'YYYY-MM-DD' strings, so the month is just the first 7 characters
+    month = df['Date'].str.slice(0, 7)
+    monthly = df.groupby(month)['PAR (MJ/m²)'].mean()
     
     print(f"\n{'Month':10} {'Avg PAR (MJ/m²/day)':20}")
     print("─" * 40)
@@ -306,10 +330,10 @@ if __name__ == "__main__":
         
         if results:
             # Save data
-            save_radiation_data(results, OUTPUT_JSON, OUTPUT_CSV)
+            df = save_radiation_data(results, OUTPUT_JSON, OUTPUT_CSV)
             
-            # Create sample analysis
-            create_sample_analysis(OUTPUT_CSV)
+            # Create sample analysis (reuses the in-memory table instead of re-reading the CSV)
+            create_sample_analysis(df)
             
             print(f"\n{'=' * 80}")
             print("✓ SOLAR RADIATION DATA FETCH COMPLETE")
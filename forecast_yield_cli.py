@@ -27,11 +27,12 @@ import json
 import sys
 import os
 import argparse
+import queue
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import math
 
-import requests
 import pandas as pd
 import numpy as np
 
@@ -71,6 +72,7 @@ from sentinel_ndvi_fetcher import SentinelHubNDVIFetcher
 from wheat_phenology_model import WheatPhenologyModel
 from wheat_rue_values import WheatRUE
 from calculate_fapar import calculate_fapar
+from fetch_solar_radiation import get_weather_session
 
 
 class YieldForecastCLI:
@@ -151,6 +153,10 @@ class YieldForecastCLI:
         self.client_secret = client_secret
         self.console = Console() if RICH_AVAILABLE else None
         
+        # Keep-alive session for Open-Meteo (transient 429/5xx answers are retried),
+        # shared with fetch_solar_radiation
+        self.weather_session = get_weather_session()
+        
     def load_geojson(self, geojson_path: str) -> Dict:
         """
         Load field geometry from GeoJSON file.
@@ -475,7 +481,7 @@ class YieldForecastCLI:
             traceback.print_exc()
             return []
     
-    def fetch_par_data(
+    def _request_par_records(
         self,
         latitude: float,
         longitude: float,
@@ -483,7 +489,9 @@ class YieldForecastCLI:
         end_date: str = None
     ) -> List[Dict]:
         """
-        Fetch PAR (Photosynthetically Active Radiation) data.
+        Download daily PAR from Open-Meteo without printing anything.
+        
+        Safe to run in a background thread while other data is fetched.
         
         Args:
             latitude: Field latitude
@@ -494,11 +502,6 @@ class YieldForecastCLI:
         Returns:
             List of daily PAR observations
         """
-        if self.console:
-            self.console.print(f"\n[bold cyan]☀️  Fetching solar radiation (PAR) data[/bold cyan]")
-        else:
-            print(f"\n☀️  Fetching solar radiation (PAR) data...")
-        
         # Calculate end date (day before yesterday, but not before planting date)
         if end_date is None:
             today = datetime.now().date()
@@ -508,37 +511,70 @@ class YieldForecastCLI:
             end_dt = max(day_before_yesterday, planting_dt)
             end_date = end_dt.strftime('%Y-%m-%d')
         
-        try:
-            url = "https://archive-api.open-meteo.com/v1/archive"
-            params = {
-                "latitude": latitude,
-                "longitude": longitude,
-                "start_date": planting_date,
-                "end_date": end_date,
-                "daily": "shortwave_radiation_sum",
-                "timezone": "America/Argentina/Buenos_Aires"
-            }
-            
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Parse response
-            par_records = []
-            daily = data.get('daily', {})
-            dates = daily.get('time', [])
-            radiation_list = daily.get('shortwave_radiation_sum', [])
+        url = "https://archive-api.open-meteo.com/v1/archive"
+        params = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "start_date": planting_date,
+            "end_date": end_date,
+            "daily": "shortwave_radiation_sum",
+            "timezone": "America/Argentina/Buenos_Aires"
+        }
+        
+        response = self.weather_session.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        
+        # Parse response (missing days come back as null -> NaN and are dropped)
+        daily = data.get('daily', {})
+        dates = daily.get('time', [])
+        total_radiation = np.array(daily.get('shortwave_radiation_sum', []), dtype=float)
+        
+        # Convert to PAR (48% of total solar radiation)
+        par = total_radiation * 0.48
+        valid = ~np.isnan(par)
+        
+        return [
+            {'date': date, 'PAR_MJ': p}
+            for date, p, ok in zip(dates, par.tolist(), valid.tolist())
+            if ok
+        ]
+    
+    def fetch_par_data(
+        self,
+        latitude: float,
+        longitude: float,
+        planting_date: str,
+        end_date: str = None,
+        pending: Optional[queue.Queue] = None
+    ) -> List[Dict]:
+        """
+        Fetch PAR (Photosynthetically Active Radiation) data.
+        
+        Args:
+            latitude: Field latitude
+            longitude: Field longitude
+            planting_date: Planting date (YYYY-MM-DD)
+            end_date: End date (default: day before yesterday)
+            pending: Queue that a ``_request_par_records`` call started in the
+                background fills with one (records, error) pair; its result is
+                used instead of a new request
             
-            for i, date in enumerate(dates):
-                total_radiation = radiation_list[i] if radiation_list[i] is not None else None
-                # Convert to PAR (48% of total solar radiation)
-                par = total_radiation * 0.48 if total_radiation is not None else None
-                
-                if par is not None:
-                    par_records.append({
-                        'date': date,
-                        'PAR_MJ': par
-                    })
+        Returns:
+            List of daily PAR observations
+        """
+        if self.console:
+            self.console.print(f"\n[bold cyan]☀️  Fetching solar radiation (PAR) data[/bold cyan]")
+        else:
+            print(f"\n☀️  Fetching solar radiation (PAR) data...")
+        
+        try:
+            if pending is not None:
+                par_records, error = pending.get()
+                if error is not None:
+                    raise error
+            else:
+                par_records = self._request_par_records(latitude, longitude, planting_date, end_date)
             
             if par_records:
                 if self.console:
@@ -651,18 +687,16 @@ class YieldForecastCLI:
             print(f"\n📊 Calculating biomass and yield...")
         
         try:
-            # Convert NDVI to fAPAR
-            fapar_weekly = []
-            for obs in ndvi_data:
-                if obs.get('ndvi_mean') is not None:
-                    fapar = calculate_fapar(obs['ndvi_mean'])
-                    fapar_weekly.append({
-                        'from': obs.get('from', obs.get('date', '')),
-                        'to': obs.get('to', obs.get('date', '')),
-                        'fapar_mean': fapar
-                    })
+            # Lay the NDVI observations out as columns once, so fAPAR and the
+            # period mid-dates are computed for the whole series at a time
+            ndvi_df = pd.DataFrame({
+                'from': [obs.get('from', obs.get('date', '')) for obs in ndvi_data],
+                'to': [obs.get('to', obs.get('date', '')) for obs in ndvi_data],
+                'ndvi_mean': [obs.get('ndvi_mean') for obs in ndvi_data]
+            })
+            ndvi_df = ndvi_df[ndvi_df['ndvi_mean'].notna()]
             
-            if not fapar_weekly:
+            if ndvi_df.empty:
                 print("✗ No valid fAPAR data")
                 return {}
             
@@ -676,22 +710,13 @@ class YieldForecastCLI:
             par_df['date'] = pd.to_datetime(par_df['date'])
             end_date = par_df['date'].max()
             
-            # Create daily fAPAR
-            weekly_df = []
-            for obs in fapar_weekly:
-                week_start = datetime.strptime(obs['from'], '%Y-%m-%d')
-                week_end = datetime.strptime(obs['to'], '%Y-%m-%d')
-                mid_date = week_start + (week_end - week_start) / 2
-                weekly_df.append({
-                    'date': mid_date,
-                    'fapar': obs['fapar_mean']
-                })
-            
-            if not weekly_df:
-                print("✗ No weekly fAPAR data")
-                return {}
-            
-            weekly_df = pd.DataFrame(weekly_df).sort_values('date')
+            # Weekly fAPAR, dated at the middle of each observation period
+            week_start = pd.to_datetime(ndvi_df['from'], format='%Y-%m-%d')
+            week_end = pd.to_datetime(ndvi_df['to'], format='%Y-%m-%d')
+            weekly_df = pd.DataFrame({
+                'date': week_start + (week_end - week_start) / 2,
+                'fapar': calculate_fapar(ndvi_df['ndvi_mean'].to_numpy(dtype=float))
+            }).sort_values('date')
             date_range = pd.date_range(start=planting_dt, end=end_date, freq='D')
             daily_df = pd.DataFrame({'date': date_range})
             
@@ -896,6 +921,24 @@ class YieldForecastCLI:
         planting_date = self.prompt_planting_date()
         variety = self.prompt_variety()
         
+        # Steps 3-4: NDVI and PAR come from independent services, so the PAR
+        # download runs in the background while NDVI is being fetched. It uses a
+        # daemon thread so that a failed NDVI fetch exits right away instead of
+        # waiting for the PAR request (and its retries) to finish.
+        par_queue: queue.Queue = queue.Queue(maxsize=1)
+        
+        def download_par():
+            try:
+                par_queue.put((self._request_par_records(
+                    field_data['center']['lat'],
+                    field_data['center']['lon'],
+                    planting_date
+                ), None))
+            except Exception as e:
+                par_queue.put((None, e))
+        
+        threading.Thread(target=download_par, daemon=True).start()
+        
         # Step 3: Fetch NDVI data
         ndvi_data = self.fetch_ndvi_data(
             field_name=field_name,
@@ -912,11 +955,12 @@ class YieldForecastCLI:
                 print(f"\n✗ {error_msg}")
             sys.exit(1)
         
-        # Step 4: Fetch PAR data
+        # Step 4: Collect PAR data
         par_data = self.fetch_par_data(
             latitude=field_data['center']['lat'],
             longitude=field_data['center']['lon'],
-            planting_date=planting_date
+            planting_date=planting_date,
+            pending=par_queue
         )
         
         if not par_data:
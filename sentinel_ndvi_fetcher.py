@@ -4,36 +4,259 @@ Sentinel-2 NDVI Data Fetcher using Sentinel Hub Statistical API
 Fetches cloud-free NDVI time series for wheat fields with safe handling of large fields.
 """
 
+import hashlib
 import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import math
+import pandas as pd
+import random
+import threading
 import time
 
+# orjson is optional; when installed it parses and writes JSON files several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Local cache root shared by the OAuth token and Statistical API response caches
+CACHE_ROOT = os.path.expanduser("~/.cache/yield-forecast")
+
+# Statistical API responses are cached here, keyed by the request payload hash
+DEFAULT_CACHE_DIR = os.path.join(CACHE_ROOT, "statistics")
+
+# Cached responses older than this are deleted when a fetcher opens the cache
+# (the end date defaults to today, so each daily run adds one entry per field)
+CACHE_MAX_AGE_DAYS = 30
+
+# Seconds subtracted from a token's lifetime so it is never used right at expiry
+TOKEN_EXPIRY_MARGIN = 60
+
+# Column layout of the CSV written by export_to_csv
+NDVI_CSV_COLUMNS = ['NDVI Mean', 'NDVI Std', 'NDVI Min', 'NDVI Max', 'NDVI P50 (Median)']
+CSV_COLUMNS = [
+    'Field Name', 'Variety', 'Sowing Date', 'Period Start', 'Period End',
+    *NDVI_CSV_COLUMNS, 'Clear Pixel %', 'Sample Count'
+]
+
+# Evalscript sent with every Statistical API request (NDVI + SCL clear-pixel mask)
+_NDVI_EVALSCRIPT = """
+//VERSION=3
+
+function setup() {
+  return {
+    input: [{
+      bands: ["B04", "B08", "SCL", "dataMask"],
+      units: "DN"
+    }],
+    output: [
+      {
+        id: "ndvi",
+        bands: 1,
+        sampleType: "FLOAT32"
+      },
+      {
+        id: "clear_pixels",
+        bands: 1,
+        sampleType: "UINT8"
+      },
+      {
+        id: "dataMask",
+        bands: 1
+      }
+    ]
+  }
+}
+
+function evaluatePixel(samples) {
+    // Calculate NDVI
+    let ndvi = (samples.B08 - samples.B04) / (samples.B08 + samples.B04);
+    
+    // Scene classification for cloud masking
+    // 4 = vegetation, 5 = bare soil, 6 = water, 7 = clouds, 8 = cloud shadow
+    let clear = (samples.SCL == 4 || samples.SCL == 5 || samples.SCL == 6) ? 1 : 0;
+    
+    return {
+        ndvi: [ndvi],
+        clear_pixels: [clear],
+        dataMask: [samples.dataMask]
+    };
+}
+"""
+
+
+def _read_json(path: str):
+    """Load a JSON file, using orjson when it is available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, obj, indent: bool = False):
+    """Write ``obj`` as JSON (2-space indented if ``indent``), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing ``max_rate`` requests per ``time_period`` seconds."""
+    
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        """
+        Initialize the limiter with a full bucket.
+        
+        Args:
+            max_rate: Maximum number of requests per period
+            time_period: Length of the period in seconds (default: 60)
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request slot is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self.max_rate / self.time_period
+                self._tokens = min(self.max_rate, self._tokens + refill)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+            
+            time.sleep(wait)
+
 
 class SentinelHubNDVIFetcher:
     """Fetch NDVI statistics from Sentinel Hub for agricultural fields."""
     
-    def __init__(self, client_id: str, client_secret: str):
+    # Retries for Statistical API requests that fail transiently
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_BACKOFF_SECONDS = 30.0
+    
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        max_requests_per_minute: int = 30,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        token_cache_dir: Optional[str] = CACHE_ROOT
+    ):
         """
         Initialize the Sentinel Hub client.
         
         Args:
             client_id: Sentinel Hub OAuth client ID
             client_secret: Sentinel Hub OAuth client secret
+            max_requests_per_minute: Client-side cap on Statistical API requests
+                (default: 30), shared by all threads using this fetcher
+            cache_dir: Directory for cached Statistical API responses, or None
+                to always query the API
+            token_cache_dir: Directory where the OAuth token is kept between runs,
+                or None to request a new token in every process
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.token = None
         self.token_expiry = None
+        self._token_lock = threading.Lock()
         self.base_url = "https://services.sentinel-hub.com"
         
+        # Reuse TCP/TLS connections across requests; the pool is sized so
+        # concurrent field workers don't discard connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        
+        # Keep request bursts within the account's processing-unit quota
+        self.rate_limiter = RateLimiter(max_requests_per_minute, 60.0)
+        self.cache_dir = cache_dir
+        if cache_dir:
+            self._prune_cache()
+        
+        # One token file per credential pair, so several accounts can share the
+        # cache and a changed or mistyped secret never reuses another's token
+        if token_cache_dir:
+            credentials = f"{client_id}\0{client_secret}".encode('utf-8')
+            client_hash = hashlib.sha256(credentials).hexdigest()[:16]
+            self.token_cache_path = os.path.join(token_cache_dir, f"sh_token_{client_hash}.json")
+        else:
+            self.token_cache_path = None
+        
+    def _token_is_valid(self) -> bool:
+        """Check whether the current OAuth token can still be used."""
+        return bool(self.token and self.token_expiry and datetime.now() < self.token_expiry)
+    
     def authenticate(self):
         """Obtain OAuth token from Sentinel Hub."""
-        if self.token and self.token_expiry and datetime.now() < self.token_expiry:
+        if self._token_is_valid():
             return self.token
         
+        # Concurrent workers wait for a single refresh instead of each
+        # requesting their own token
+        with self._token_lock:
+            if self._token_is_valid() or self._load_cached_token():
+                return self.token
+            return self._request_token()
+    
+    def _load_cached_token(self) -> bool:
+        """Reuse an unexpired token saved by a previous run, if there is one."""
+        if not self.token_cache_path or not os.path.exists(self.token_cache_path):
+            return False
+        
+        try:
+            with open(self.token_cache_path, 'r') as f:
+                cached = json.load(f)
+            expiry = datetime.fromisoformat(cached['expiry'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        if expiry <= datetime.now() + timedelta(seconds=TOKEN_EXPIRY_MARGIN):
+            return False
+        
+        self.token = cached['token']
+        self.token_expiry = expiry
+        return True
+    
+    def _save_cached_token(self):
+        """Persist the current token so the next run can skip authentication."""
+        if not self.token_cache_path:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
+            # Create the file owner-readable only; it holds a bearer token
+            fd = os.open(self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'token': self.token, 'expiry': self.token_expiry.isoformat()}, f)
+            os.chmod(self.token_cache_path, 0o600)
+        except OSError as e:
+            print(f"⚠ Could not cache access token: {e}")
+    
+    def _request_token(self):
+        """Request a new OAuth token (caller must hold ``_token_lock``)."""
         print("Authenticating with Sentinel Hub...")
         
         url = f"{self.base_url}/oauth/token"
@@ -44,13 +267,16 @@ class SentinelHubNDVIFetcher:
         }
         
         try:
-            response = requests.post(url, data=payload, timeout=30)
+            response = self.session.post(url, data=payload, timeout=30)
             response.raise_for_status()
             
             data = response.json()
             self.token = data['access_token']
-            # Set expiry to 50 minutes (tokens last 60 minutes)
-            self.token_expiry = datetime.now() + timedelta(minutes=50)
+            # Use the lifetime reported by the server (tokens last 60 minutes),
+            # minus a safety margin
+            expires_in = data.get('expires_in', 3600)
+            self.token_expiry = datetime.now() + timedelta(seconds=expires_in - TOKEN_EXPIRY_MARGIN)
+            self._save_cached_token()
             
             print("✓ Authentication successful")
             return self.token
@@ -59,6 +285,133 @@ class SentinelHubNDVIFetcher:
             print(f"✗ Authentication failed: {e}")
             raise
     
+    @staticmethod
+    def _retry_after_seconds(response: requests.Response, default: float) -> float:
+        """Read the delay requested by the server's Retry-After header."""
+        try:
+            return max(0.0, float(response.headers['Retry-After']))
+        except (KeyError, TypeError, ValueError):
+            return default
+    
+    def _post_statistics(self, url: str, headers: Dict, payload: Dict) -> requests.Response:
+        """
+        POST a Statistical API request through the rate limiter.
+        
+        Rate-limited (429), server-side (5xx) and timed-out requests are
+        retried up to MAX_RETRIES times, waiting for the server's Retry-After
+        delay when given and otherwise backing off exponentially with jitter.
+        
+        Args:
+            url: Statistical API endpoint
+            headers: Request headers including the bearer token
+            payload: Request payload
+            
+        Returns:
+            The final response (status not yet checked)
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            backoff = min(2 ** attempt + random.random(), self.MAX_BACKOFF_SECONDS)
+            self.rate_limiter.acquire()
+            
+            try:
+                response = self.session.post(
+                    url,
+                    headers=headers,
+                    json=payload,
+                    timeout=60
+                )
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                print(f"  ⚠ {type(e).__name__}, retrying in {backoff:.1f}s")
+                time.sleep(backoff)
+                continue
+            
+            if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_RETRIES:
+                return response
+            
+            delay = self._retry_after_seconds(response, default=backoff)
+            print(f"  ⚠ HTTP {response.status_code} from Sentinel Hub, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        
+        return response
+    
+    def _prune_cache(self):
+        """Delete cached responses (and leftover temporary files) older than CACHE_MAX_AGE_DAYS."""
+        cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+        try:
+            entries = os.scandir(self.cache_dir)
+        except OSError:
+            return  # Cache directory not created yet
+        
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(('.json', '.tmp')):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass  # Removed concurrently or not ours to delete
+    
+    def _cache_path(self, payload: Dict) -> Optional[str]:
+        """Return the cache file for a request payload, or None if caching is off."""
+        if not self.cache_dir:
+            return None
+        
+        key = hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_cached_response(self, payload: Dict) -> Optional[Dict]:
+        """Return the cached Statistical API response for a payload, if any."""
+        path = self._cache_path(payload)
+        if path is None or not os.path.exists(path):
+            return None
+        
+        try:
+            return _read_json(path)['response']
+        except (OSError, ValueError, KeyError):
+            # Unreadable or partial entry - fall back to the API
+            return None
+    
+    @staticmethod
+    def _is_cacheable(response_data: Dict) -> bool:
+        """
+        Check whether a Statistical API response is complete enough to cache.
+        
+        Intervals that failed server-side come back inside an HTTP 200 body with
+        an 'error' entry; caching them would turn a transient failure into a
+        permanent gap, so such responses are always re-requested.
+        """
+        if response_data.get('status', 'OK') != 'OK':
+            return False
+        return not any('error' in entry for entry in response_data.get('data', []))
+    
+    def _save_cached_response(self, payload: Dict, response_data: Dict):
+        """Store a Statistical API response along with the request it answers (if it has no failed intervals)."""
+        path = self._cache_path(payload)
+        if path is None or not self._is_cacheable(response_data):
+            return
+        
+        evalscript = payload['aggregation']['evalscript']
+        entry = {
+            'request': {
+                'bbox': payload['input']['bounds']['bbox'],
+                'time_range': payload['aggregation']['timeRange'],
+                'evalscript_sha256': hashlib.sha256(evalscript.encode('utf-8')).hexdigest()
+            },
+            'response': response_data
+        }
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            _write_json(tmp_path, entry)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  ⚠ Could not write response cache: {e}")
+    
     def calculate_field_area(self, coordinates: List[List[float]]) -> float:
         """
         Calculate field area in hectares using shoelace formula.
@@ -219,49 +572,7 @@ class SentinelHubNDVIFetcher:
                 },
                 "resx": (bbox[2] - bbox[0]) / width,
                 "resy": (bbox[3] - bbox[1]) / height,
-                "evalscript": """
-//VERSION=3
-
-function setup() {
-  return {
-    input: [{
-      bands: ["B04", "B08", "SCL", "dataMask"],
-      units: "DN"
-    }],
-    output: [
-      {
-        id: "ndvi",
-        bands: 1,
-        sampleType: "FLOAT32"
-      },
-      {
-        id: "clear_pixels",
-        bands: 1,
-        sampleType: "UINT8"
-      },
-      {
-        id: "dataMask",
-        bands: 1
-      }
-    ]
-  }
-}
-
-function evaluatePixel(samples) {
-    // Calculate NDVI
-    let ndvi = (samples.B08 - samples.B04) / (samples.B08 + samples.B04);
-    
-    // Scene classification for cloud masking
-    // 4 = vegetation, 5 = bare soil, 6 = water, 7 = clouds, 8 = cloud shadow
-    let clear = (samples.SCL == 4 || samples.SCL == 5 || samples.SCL == 6) ? 1 : 0;
-    
-    return {
-        ndvi: [ndvi],
-        clear_pixels: [clear],
-        dataMask: [samples.dataMask]
-    };
-}
-"""
+                "evalscript": _NDVI_EVALSCRIPT
             },
             "calculations": {
                 "ndvi": {
@@ -311,9 +622,12 @@ function evaluatePixel(samples) {
         area_ha = self.calculate_field_area(coordinates)
         dims = self.calculate_safe_dimensions(coordinates)
         
-        print(f"\n  Field: {field_name}")
-        print(f"  Area: {area_ha:.2f} ha")
-        print(f"  Dimensions: {dims['width']}x{dims['height']} pixels @ {dims['resolution']:.0f}m resolution")
+        # One print per block keeps lines together when fields are fetched concurrently
+        print(
+            f"\n  Field: {field_name}\n"
+            f"  Area: {area_ha:.2f} ha\n"
+            f"  Dimensions: {dims['width']}x{dims['height']} pixels @ {dims['resolution']:.0f}m resolution"
+        )
         
         # Build request
         request_payload = self.build_statistical_request(
@@ -333,15 +647,16 @@ function evaluatePixel(samples) {
         }
         
         try:
-            response = requests.post(
-                url, 
-                headers=headers, 
-                json=request_payload,
-                timeout=60
-            )
-            response.raise_for_status()
+            data = self._load_cached_response(request_payload)
             
-            data = response.json()
+            if data is not None:
+                print(f"  ✓ Using cached Statistical API response for {field_name}")
+            else:
+                response = self._post_statistics(url, headers, request_payload)
+                response.raise_for_status()
+                
+                data = response.json()
+                self._save_cached_response(request_payload, data)
             
             # Parse results
             results = []
@@ -374,24 +689,93 @@ function evaluatePixel(samples) {
                         'sample_count': ndvi_stats.get('sampleCount', 0)
                     })
             
-            print(f"  ✓ Retrieved {len(results)} time periods")
+            print(f"  ✓ Retrieved {len(results)} time periods for {field_name}")
             return results
             
         except requests.exceptions.RequestException as e:
-            print(f"  ✗ Error fetching data: {e}")
+            message = f"  ✗ Error fetching data ({field_name}): {e}"
             if hasattr(e.response, 'text'):
-                print(f"  Response: {e.response.text[:500]}")
+                message += f"\n  Response: {e.response.text[:500]}"
+            print(message)
             return []
 
 
-def process_all_fields(geojson_path: str, client_id: str, client_secret: str) -> Dict:
+def _process_feature(
+    fetcher: SentinelHubNDVIFetcher,
+    idx: int,
+    total_fields: int,
+    feature: Dict
+) -> Optional[Tuple[str, Dict]]:
+    """
+    Fetch the NDVI time series for a single GeoJSON feature.
+    
+    Args:
+        fetcher: Authenticated NDVI fetcher (shared between workers)
+        idx: 1-based position of the feature in the collection
+        total_fields: Number of features in the collection
+        feature: GeoJSON feature
+        
+    Returns:
+        (field_name, field_result) tuple, or None if the field was skipped
+    """
+    props = feature['properties']
+    geom = feature['geometry']
+    
+    field_name = props.get('field_name', f'Field_{idx}')
+    sowing_date = props.get('sowing_date')
+    variety = props.get('wheat_variety', 'Unknown')
+    
+    if not sowing_date or sowing_date == 'N/A':
+        print(f"\n[{idx}/{total_fields}] Skipping {field_name}: no sowing date")
+        return None
+    
+    print(
+        f"\n[{idx}/{total_fields}] Processing {field_name} ({variety})\n"
+        f"  Sowing date: {sowing_date}"
+    )
+    
+    try:
+        ndvi_data = fetcher.fetch_ndvi_time_series(
+            field_name,
+            geom,
+            sowing_date
+        )
+        
+        return field_name, {
+            'variety': variety,
+            'sowing_date': sowing_date,
+            'ndvi_time_series': ndvi_data,
+            'coordinates': geom['coordinates'][0]
+        }
+        
+    except Exception as e:
+        print(f"  ✗ Error processing field {field_name}: {e}")
+        return field_name, {
+            'variety': variety,
+            'sowing_date': sowing_date,
+            'ndvi_time_series': [],
+            'error': str(e)
+        }
+
+
+def process_all_fields(
+    geojson_path: str,
+    client_id: str,
+    client_secret: str,
+    max_workers: int = 6
+) -> Dict:
     """
     Process all fields and fetch NDVI time series.
     
+    Requests are I/O-bound, so fields are fetched concurrently by a small
+    thread pool. ``max_workers`` bounds the number of in-flight requests to
+    stay within Sentinel Hub's per-account limits.
+    
     Args:
         geojson_path: Path to GeoJSON file
         client_id: Sentinel Hub client ID
         client_secret: Sentinel Hub client secret
+        max_workers: Maximum number of concurrent field requests (default: 6)
         
     Returns:
         Dictionary with NDVI data for all fields
@@ -401,59 +785,36 @@ def process_all_fields(geojson_path: str, client_id: str, client_secret: str) ->
     print("=" * 80)
     
     # Load field data
-    with open(geojson_path, 'r') as f:
-        data = json.load(f)
+    data = _read_json(geojson_path)
     
-    # Initialize fetcher
+    # Initialize fetcher and authenticate once, so workers share the token
     fetcher = SentinelHubNDVIFetcher(client_id, client_secret)
+    try:
+        fetcher.authenticate()
+    except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+        print(f"\n✗ Cannot fetch NDVI without a Sentinel Hub token: {e}")
+        print("   Check SENTINEL_HUB_CLIENT_ID / SENTINEL_HUB_CLIENT_SECRET and your connection")
+        return {}
     
     # Process each field
     results = {}
     total_fields = len(data['features'])
     
-    print(f"\nProcessing {total_fields} fields...")
+    print(f"\nProcessing {total_fields} fields ({max_workers} concurrent requests)...")
     print("=" * 80)
     
-    for idx, feature in enumerate(data['features'], 1):
-        props = feature['properties']
-        geom = feature['geometry']
-        
-        field_name = props.get('field_name', f'Field_{idx}')
-        sowing_date = props.get('sowing_date')
-        variety = props.get('wheat_variety', 'Unknown')
-        
-        if not sowing_date or sowing_date == 'N/A':
-            print(f"\n[{idx}/{total_fields}] Skipping {field_name}: no sowing date")
-            continue
-        
-        print(f"\n[{idx}/{total_fields}] Processing {field_name} ({variety})")
-        print(f"  Sowing date: {sowing_date}")
-        
-        try:
-            ndvi_data = fetcher.fetch_ndvi_time_series(
-                field_name,
-                geom,
-                sowing_date
-            )
-            
-            results[field_name] = {
-                'variety': variety,
-                'sowing_date': sowing_date,
-                'ndvi_time_series': ndvi_data,
-                'coordinates': geom['coordinates'][0]
-            }
-            
-            # Rate limiting - be nice to the API
-            time.sleep(0.5)
-            
-        except Exception as e:
-            print(f"  ✗ Error processing field: {e}")
-            results[field_name] = {
-                'variety': variety,
-                'sowing_date': sowing_date,
-                'ndvi_time_series': [],
-                'error': str(e)
-            }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_process_feature, fetcher, idx, total_fields, feature)
+            for idx, feature in enumerate(data['features'], 1)
+        ]
+        
+        # Collect in GeoJSON order so the output is deterministic
+        for future in futures:
+            outcome = future.result()
+            if outcome is not None:
+                field_name, field_result = outcome
+                results[field_name] = field_result
     
     return results
 
@@ -466,8 +827,7 @@ def save_results(results: Dict, output_path: str):
         'fields': results
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    _write_json(output_path, output_data, indent=True)
     
     print(f"\n{'=' * 80}")
     print(f"✓ Results saved to: {output_path}")
@@ -483,38 +843,36 @@ def save_results(results: Dict, output_path: str):
 
 def export_to_csv(results: Dict, output_path: str):
     """Export NDVI data to CSV format."""
-    import csv
-    
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Header
-        writer.writerow([
-            'Field Name', 'Variety', 'Sowing Date', 'Period Start', 'Period End',
-            'NDVI Mean', 'NDVI Std', 'NDVI Min', 'NDVI Max',
-            'NDVI P50 (Median)', 'Clear Pixel %', 'Sample Count'
-        ])
-        
-        # Data rows
-        for field_name, field_data in results.items():
-            variety = field_data.get('variety', 'Unknown')
-            sowing_date = field_data.get('sowing_date', 'N/A')
-            
-            for period in field_data.get('ndvi_time_series', []):
-                writer.writerow([
-                    field_name,
-                    variety,
-                    sowing_date,
-                    period.get('from', ''),
-                    period.get('to', ''),
-                    round(period.get('ndvi_mean', 0), 4) if period.get('ndvi_mean') else '',
-                    round(period.get('ndvi_std', 0), 4) if period.get('ndvi_std') else '',
-                    round(period.get('ndvi_min', 0), 4) if period.get('ndvi_min') else '',
-                    round(period.get('ndvi_max', 0), 4) if period.get('ndvi_max') else '',
-                    round(period.get('ndvi_p50', 0), 4) if period.get('ndvi_p50') else '',
-                    round(period.get('clear_percentage', 0), 1),
-                    period.get('sample_count', 0)
-                ])
+    rows = []
+    for field_name, field_data in results.items():
+        variety = field_data.get('variety', 'Unknown')
+        sowing_date = field_data.get('sowing_date', 'N/A')
+        
+        for period in field_data.get('ndvi_time_series', []):
+            rows.append((
+                field_name,
+                variety,
+                sowing_date,
+                period.get('from', ''),
+                period.get('to', ''),
+                period.get('ndvi_mean'),
+                period.get('ndvi_std'),
+                period.get('ndvi_min'),
+                period.get('ndvi_max'),
+                period.get('ndvi_p50'),
+                period.get('clear_percentage', 0),
+                period.get('sample_count', 0)
+            ))
+    
+    df = pd.DataFrame.from_records(rows, columns=CSV_COLUMNS)
+    
+    # Missing (or exactly zero) NDVI statistics are written as empty cells
+    ndvi = df[NDVI_CSV_COLUMNS].astype(float)
+    df[NDVI_CSV_COLUMNS] = ndvi.round(4).where(ndvi.fillna(0) != 0, '')
+    df['Clear Pixel %'] = df['Clear Pixel %'].round(1)
+    
+    # Keep the csv module's CRLF row terminator so existing exports stay byte-identical
+    df.to_csv(output_path, index=False, lineterminator='\r\n')
     
     print(f"✓ CSV export saved to: {output_path}")
 
@@ -534,6 +892,8 @@ if __name__ == "__main__":
     try:
         # Fetch NDVI data for all fields
         results = process_all_fields(GEOJSON_PATH, CLIENT_ID, CLIENT_SECRET)
+        if not results:
+            exit(1)
         
         # Save results
         save_results(results, 'sentinel_ndvi_data.json')
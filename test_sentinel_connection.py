@@ -5,6 +5,7 @@ Run this before processing all fields to verify your credentials and API access.
 """
 
 import json
+from typing import Dict
 from sentinel_ndvi_fetcher import SentinelHubNDVIFetcher
 
 
@@ -14,7 +15,8 @@ def test_authentication(client_id: str, client_secret: str):
     print("TEST 1: AUTHENTICATION")
     print("=" * 80)
     
-    fetcher = SentinelHubNDVIFetcher(client_id, client_secret)
+    # No token cache, so the credentials are always checked against the server
+    fetcher = SentinelHubNDVIFetcher(client_id, client_secret, token_cache_dir=None)
     
     try:
         token = fetcher.authenticate()
@@ -26,16 +28,18 @@ def test_authentication(client_id: str, client_secret: str):
         return None
 
 
-def test_single_field(fetcher: SentinelHubNDVIFetcher, geojson_path: str):
+def load_fields(geojson_path: str) -> Dict:
+    """Load the field GeoJSON once so every test can share it."""
+    with open(geojson_path, 'r') as f:
+        return json.load(f)
+
+
+def test_single_field(fetcher: SentinelHubNDVIFetcher, data: Dict):
     """Test NDVI fetch for a single field."""
     print("\n" + "=" * 80)
     print("TEST 2: FETCH NDVI FOR SAMPLE FIELD")
     print("=" * 80)
     
-    # Load GeoJSON
-    with open(geojson_path, 'r') as f:
-        data = json.load(f)
-    
     # Find a field with valid sowing date
     test_field = None
     for feature in data['features']:
@@ -105,15 +109,12 @@ def test_single_field(fetcher: SentinelHubNDVIFetcher, geojson_path: str):
         return False
 
 
-def test_multiple_fields(fetcher: SentinelHubNDVIFetcher, geojson_path: str, num_fields: int = 3):
+def test_multiple_fields(fetcher: SentinelHubNDVIFetcher, data: Dict, num_fields: int = 3):
     """Test NDVI fetch for multiple fields."""
     print("\n" + "=" * 80)
     print(f"TEST 3: FETCH NDVI FOR {num_fields} SAMPLE FIELDS")
     print("=" * 80)
     
-    with open(geojson_path, 'r') as f:
-        data = json.load(f)
-    
     # Get first N fields with valid sowing dates
     test_fields = []
     for feature in data['features']:
@@ -191,14 +192,16 @@ def main():
         print("\nYou can find these at: https://apps.sentinel-hub.com/dashboard/#/account/settings")
         return
     
-    # Test 2: Single field
     try:
-        single_success = test_single_field(fetcher, GEOJSON_PATH)
+        data = load_fields(GEOJSON_PATH)
     except FileNotFoundError:
         print(f"\n✗ Error: Could not find {GEOJSON_PATH}")
         print("Make sure you're running this script from the project directory")
         return
     
+    # Test 2: Single field
+    single_success = test_single_field(fetcher, data)
+    
     if not single_success:
         print("\n" + "=" * 80)
         print("❌ TESTS FAILED - Could not fetch NDVI for test field")
@@ -211,7 +214,7 @@ def main():
         return
     
     # Test 3: Multiple fields
-    multi_success = test_multiple_fields(fetcher, GEOJSON_PATH, num_fields=3)
+    multi_success = test_multiple_fields(fetcher, data, num_fields=3)
     
     # Summary
     print("\n" + "=" * 80)
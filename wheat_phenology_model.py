@@ -6,10 +6,124 @@ This model estimates wheat growth stages similar to the CronoTrigo approach
 """
 
 import json
+from collections import namedtuple
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 import math
 
+import numpy as np
+
+# Photoperiod constants folded once: day of year -> declination angle (rad/day),
+# peak solar declination (rad), and hour angle (rad) -> day length (hours)
+_RAD_PER_DOY = math.radians(360.0 / 365.0)
+_MAX_DECLINATION_RAD = math.radians(23.45)
+_HOURS_PER_RAD = 2.0 * math.degrees(1.0) / 15.0
+
+# Numba is optional; when installed the GDD accumulation kernel is JIT-compiled
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# ijson is optional; when installed GeoJSON features are streamed one at a time
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _accumulate_gdd_loop(tmin: np.ndarray, tmax: np.ndarray, base_temp: float, max_temp: float) -> np.ndarray:
+    """
+    Accumulate daily growing degree days with an explicit loop (Numba kernel).
+    
+    Args:
+        tmin: Daily minimum temperatures (°C)
+        tmax: Daily maximum temperatures (°C)
+        base_temp: Base temperature (°C)
+        max_temp: Maximum temperature (°C)
+        
+    Returns:
+        Accumulated GDD at the end of each day; a day with a missing (NaN)
+        temperature scores 0 GDD, as in calculate_gdd
+    
+    >>> _accumulate_gdd_loop(np.array([5.0, np.nan, 5.0]), np.array([15.0, 15.0, 15.0]), 0.0, 35.0)
+    array([10., 10., 20.])
+    """
+    out = np.empty(tmin.shape[0])
+    total = 0.0
+    for i in range(tmin.shape[0]):
+        tavg = (tmin[i] + tmax[i]) / 2.0
+        if not (tavg >= base_temp):  # below base, or NaN
+            tavg = base_temp
+        elif tavg > max_temp:
+            tavg = max_temp
+        total += tavg - base_temp
+        out[i] = total
+    return out
+
+
+def _accumulate_gdd_numpy(tmin: np.ndarray, tmax: np.ndarray, base_temp: float, max_temp: float) -> np.ndarray:
+    """
+    Accumulate daily growing degree days with NumPy ufuncs (same result as the loop kernel).
+    
+    >>> _accumulate_gdd_numpy(np.array([5.0, np.nan, 5.0]), np.array([15.0, 15.0, 15.0]), 0.0, 35.0)
+    array([10., 10., 20.])
+    """
+    tavg = (tmin + tmax) / 2.0
+    # A missing (NaN) day scores 0 GDD instead of poisoning the running total
+    tavg = np.where(np.isnan(tavg), base_temp, tavg)
+    return np.cumsum(np.clip(tavg, base_temp, max_temp) - base_temp)
+
+
+if NUMBA_AVAILABLE:
+    _accumulate_gdd = njit(cache=True)(_accumulate_gdd_loop)
+else:
+    _accumulate_gdd = _accumulate_gdd_numpy
+
+
+class WeatherFrame(namedtuple('WeatherFrame', 'dates tmin tmax')):
+    """
+    Daily weather held as parallel NumPy arrays.
+    
+    - dates: chronological days (datetime64[D])
+    - tmin: minimum daily temperature (°C)
+    - tmax: maximum daily temperature (°C)
+    """
+    
+    __slots__ = ()
+    
+    @classmethod
+    def from_records(cls, records: List[Dict]) -> 'WeatherFrame':
+        """
+        Build a WeatherFrame from daily weather records.
+        
+        Args:
+            records: List of daily weather records with 'date', 'tmin', 'tmax'
+            
+        Returns:
+            WeatherFrame with one array entry per record. Missing temperatures
+            (None or NaN) become NaN, and the GDD kernels score such a day as
+            0 GDD, as calculate_gdd does for NaN
+        
+        >>> frame = WeatherFrame.from_records([
+        ...     {'date': '2025-06-01', 'tmin': 5.0, 'tmax': 15.0},
+        ...     {'date': '2025-06-02', 'tmin': None, 'tmax': 15.0},
+        ... ])
+        >>> frame.tmin
+        array([ 5., nan])
+        >>> _accumulate_gdd(frame.tmin, frame.tmax, 0.0, 35.0)
+        array([10., 10.])
+        """
+        # Temperatures stay float64: summed in float32 over a season, GDD drifts
+        # by ~0.1 and can move a stage date when the total lands on a threshold
+        return cls(
+            dates=np.array([r['date'] for r in records], dtype='datetime64[D]'),
+            tmin=np.array([r['tmin'] for r in records], dtype=float),
+            tmax=np.array([r['tmax'] for r in records], dtype=float),
+        )
+
 
 class WheatPhenologyModel:
     """
@@ -24,11 +138,25 @@ class WheatPhenologyModel:
     - Maturity (Zadoks 90)
     """
     
+    # Fixed instance layout (no per-instance __dict__); keep in sync with __init__
+    __slots__ = ('variety', 'sowing_date', '_sowing_day', 'latitude',
+                 'params', '_thresholds', '_photoperiod_table')
+    
     # Base temperatures for wheat development
     BASE_TEMP = 0.0  # Base temperature (°C)
     OPT_TEMP = 20.0  # Optimal temperature (°C)
     MAX_TEMP = 35.0  # Maximum temperature (°C)
     
+    # Phenological stages in thermal-time order: (stage_dates key, GDD parameter, report label)
+    STAGES = (
+        ("emergence", "gdd_emergence", "Emergence"),
+        ("tillering", "gdd_tillering", "Tillering"),
+        ("stem_extension", "gdd_stem_extension", "Stem Extension (Zadoks 30)"),
+        ("heading", "gdd_heading", "Heading/Anthesis (Zadoks 60)"),
+        ("grain_fill", "gdd_grain_fill", "Grain Fill (Zadoks 70)"),
+        ("maturity", "gdd_maturity", "Maturity (Zadoks 90)"),
+    )
+    
     # Variety parameters (thermal time requirements in °C·days)
     # Based on CRONOTRIGO model (FAUBA) and typical Argentine wheat varieties
     # Parameters estimated from maturity groups: Early (~2100 GDD), Medium (~2150-2200 GDD), Late (~2230+ GDD)
@@ -473,6 +601,18 @@ class WheatPhenologyModel:
         },
     }
     
+    # Default parameters for unknown varieties
+    DEFAULT_PARAMS = {
+        "vernalization_requirement": "medium",
+        "photoperiod_sensitivity": "medium",
+        "gdd_emergence": 145,
+        "gdd_tillering": 395,
+        "gdd_stem_extension": 890,
+        "gdd_heading": 1440,
+        "gdd_grain_fill": 1840,
+        "gdd_maturity": 2180,
+    }
+    
     def __init__(self, variety: str, sowing_date: str, latitude: float):
         """
         Initialize the phenology model for a specific field.
@@ -484,23 +624,18 @@ class WheatPhenologyModel:
         """
         self.variety = variety
         self.sowing_date = datetime.strptime(sowing_date, '%Y-%m-%d')
+        self._sowing_day = np.datetime64(self.sowing_date.date(), 'D')
         self.latitude = latitude
         
         # Get variety parameters or use default
-        if variety in self.VARIETY_PARAMS:
-            self.params = self.VARIETY_PARAMS[variety]
-        else:
-            # Default parameters for unknown varieties
-            self.params = {
-                "vernalization_requirement": "medium",
-                "photoperiod_sensitivity": "medium",
-                "gdd_emergence": 145,
-                "gdd_tillering": 395,
-                "gdd_stem_extension": 890,
-                "gdd_heading": 1440,
-                "gdd_grain_fill": 1840,
-                "gdd_maturity": 2180,
-            }
+        self.params = self.VARIETY_PARAMS.get(variety, self.DEFAULT_PARAMS)
+        
+        # Stage thresholds in STAGES order, read from params so subclasses and
+        # varieties added at runtime get their own thresholds
+        self._thresholds = np.array([self.params[gdd_key] for _, gdd_key, _ in self.STAGES], dtype=float)
+        
+        # Day length by day of year, built on first use (see calculate_photoperiod)
+        self._photoperiod_table = None
     
     def calculate_gdd(self, tmin: float, tmax: float) -> float:
         """
@@ -515,14 +650,8 @@ class WheatPhenologyModel:
         """
         tavg = (tmin + tmax) / 2.0
         
-        # Constrain to valid range
-        if tavg < self.BASE_TEMP:
-            return 0.0
-        elif tavg > self.MAX_TEMP:
-            tavg = self.MAX_TEMP
-        
-        gdd = tavg - self.BASE_TEMP
-        return max(0.0, gdd)
+        # Cap at MAX_TEMP; anything below BASE_TEMP contributes nothing
+        return max(0.0, min(tavg, self.MAX_TEMP) - self.BASE_TEMP)
     
     def calculate_photoperiod(self, date: datetime) -> float:
         """
@@ -534,37 +663,41 @@ class WheatPhenologyModel:
         Returns:
             Day length in hours
         """
-        lat_rad = math.radians(self.latitude)
-        day_of_year = date.timetuple().tm_yday
+        if self._photoperiod_table is None:
+            self._photoperiod_table = self._build_photoperiod_table()
         
-        # Solar declination
-        declination = 23.45 * math.sin(math.radians(360 / 365 * (day_of_year - 81)))
-        dec_rad = math.radians(declination)
+        return float(self._photoperiod_table[date.timetuple().tm_yday - 1])
+    
+    def _build_photoperiod_table(self) -> np.ndarray:
+        """
+        Compute day length for every day of the year at this field's latitude.
         
-        # Hour angle at sunrise/sunset
-        cos_hour_angle = -math.tan(lat_rad) * math.tan(dec_rad)
+        Returns:
+            Array of 366 day lengths in hours, indexed by day of year - 1
+        """
+        day_of_year = np.arange(1, 367)
         
-        # Handle polar day/night
-        if cos_hour_angle > 1:
-            return 0.0
-        elif cos_hour_angle < -1:
-            return 24.0
+        # Solar declination (radians)
+        dec_rad = _MAX_DECLINATION_RAD * np.sin(_RAD_PER_DOY * (day_of_year - 81))
         
-        hour_angle = math.acos(cos_hour_angle)
-        photoperiod = 2 * math.degrees(hour_angle) / 15.0
+        # Hour angle at sunrise/sunset
+        cos_hour_angle = -math.tan(math.radians(self.latitude)) * np.tan(dec_rad)
         
-        return photoperiod
+        # Clipping handles polar day/night: arccos(1) gives 0 h, arccos(-1) gives 24 h
+        hour_angle = np.arccos(np.clip(cos_hour_angle, -1.0, 1.0))
+        return hour_angle * _HOURS_PER_RAD
     
     def estimate_phenology(
         self, 
-        weather_data: List[Dict],
+        weather_data: Union[List[Dict], WeatherFrame],
         current_date: datetime = None
     ) -> Dict:
         """
         Estimate phenological stages based on weather data.
         
         Args:
-            weather_data: List of daily weather records with 'date', 'tmin', 'tmax'
+            weather_data: List of daily weather records with 'date', 'tmin', 'tmax',
+                or the same data already converted to a WeatherFrame
             current_date: Current date for estimation (defaults to today)
             
         Returns:
@@ -573,7 +706,10 @@ class WheatPhenologyModel:
         if current_date is None:
             current_date = datetime.now()
         
-        accumulated_gdd = 0.0
+        if not isinstance(weather_data, WeatherFrame):
+            weather_data = WeatherFrame.from_records(weather_data)
+        dates, tmin, tmax = weather_data
+        
         current_stage = "Sowing"
         stage_dates = {
             "sowing": self.sowing_date.strftime('%Y-%m-%d'),
@@ -585,38 +721,34 @@ class WheatPhenologyModel:
             "maturity": None,
         }
         
-        # Process each day from sowing
-        for weather in weather_data:
-            date = datetime.strptime(weather['date'], '%Y-%m-%d')
-            
-            if date < self.sowing_date:
-                continue
-            if date > current_date:
-                break
-            
-            # Calculate daily GDD
-            daily_gdd = self.calculate_gdd(weather['tmin'], weather['tmax'])
-            accumulated_gdd += daily_gdd
-            
-            # Determine current stage based on accumulated GDD
-            if accumulated_gdd >= self.params['gdd_maturity'] and stage_dates['maturity'] is None:
-                current_stage = "Maturity (Zadoks 90)"
-                stage_dates['maturity'] = date.strftime('%Y-%m-%d')
-            elif accumulated_gdd >= self.params['gdd_grain_fill'] and stage_dates['grain_fill'] is None:
-                current_stage = "Grain Fill (Zadoks 70)"
-                stage_dates['grain_fill'] = date.strftime('%Y-%m-%d')
-            elif accumulated_gdd >= self.params['gdd_heading'] and stage_dates['heading'] is None:
-                current_stage = "Heading/Anthesis (Zadoks 60)"
-                stage_dates['heading'] = date.strftime('%Y-%m-%d')
-            elif accumulated_gdd >= self.params['gdd_stem_extension'] and stage_dates['stem_extension'] is None:
-                current_stage = "Stem Extension (Zadoks 30)"
-                stage_dates['stem_extension'] = date.strftime('%Y-%m-%d')
-            elif accumulated_gdd >= self.params['gdd_tillering'] and stage_dates['tillering'] is None:
-                current_stage = "Tillering"
-                stage_dates['tillering'] = date.strftime('%Y-%m-%d')
-            elif accumulated_gdd >= self.params['gdd_emergence'] and stage_dates['emergence'] is None:
-                current_stage = "Emergence"
-                stage_dates['emergence'] = date.strftime('%Y-%m-%d')
+        # Records are chronological: stop at the first day after current_date,
+        # then drop the days before sowing
+        after_current = dates > np.datetime64(current_date.date())
+        stop = int(np.argmax(after_current)) if after_current.any() else len(dates)
+        in_season = dates[:stop] >= self._sowing_day
+        dates = dates[:stop][in_season]
+        
+        # Daily GDD (same clamping as calculate_gdd), accumulated day by day
+        cumulative_gdd = _accumulate_gdd(
+            tmin[:stop][in_season],
+            tmax[:stop][in_season],
+            self.BASE_TEMP,
+            self.MAX_TEMP
+        )
+        accumulated_gdd = float(cumulative_gdd[-1]) if len(cumulative_gdd) else 0.0
+        
+        # First day each stage threshold is reached. Consecutive thresholds are
+        # further apart than one day's maximum GDD, so at most one stage starts per day.
+        crossings = np.searchsorted(cumulative_gdd, self._thresholds, side='left')
+        
+        # Thresholds increase, so the stages reached so far are a prefix of STAGES;
+        # format all of their dates in one call
+        n_reached = int(np.count_nonzero(crossings < len(dates)))
+        stage_days = np.datetime_as_string(dates[crossings[:n_reached]], unit='D').tolist()
+        for (stage_key, _, _), day in zip(self.STAGES, stage_days):
+            stage_dates[stage_key] = day
+        if n_reached:
+            current_stage = self.STAGES[n_reached - 1][2]
         
         # Calculate progress to next stage
         next_stage_gdd = self._get_next_stage_gdd(accumulated_gdd)
@@ -637,69 +769,92 @@ class WheatPhenologyModel:
     
     def _get_next_stage_gdd(self, current_gdd: float) -> float:
         """Get the GDD requirement for the next phenological stage."""
-        stages = [
-            self.params['gdd_emergence'],
-            self.params['gdd_tillering'],
-            self.params['gdd_stem_extension'],
-            self.params['gdd_heading'],
-            self.params['gdd_grain_fill'],
-            self.params['gdd_maturity'],
-        ]
-        
-        for stage_gdd in stages:
-            if current_gdd < stage_gdd:
-                return stage_gdd
+        idx = int(np.searchsorted(self._thresholds, current_gdd, side='right'))
+        if idx < len(self._thresholds):
+            return self.params[self.STAGES[idx][1]]
         
         return None
     
     def predict_future_stages(
         self,
-        weather_data: List[Dict],
-        forecast_data: List[Dict] = None
+        weather_data: Union[List[Dict], WeatherFrame],
+        forecast_data: Union[List[Dict], WeatherFrame] = None
     ) -> Dict:
         """
         Predict future phenological stage dates.
         
         Args:
-            weather_data: Historical weather data
-            forecast_data: Forecasted weather data (optional)
+            weather_data: Historical weather data (records or a WeatherFrame)
+            forecast_data: Forecasted weather data (optional, records or a WeatherFrame)
             
         Returns:
             Predicted dates for all phenological stages
         """
-        all_data = weather_data.copy()
+        if not isinstance(weather_data, WeatherFrame):
+            weather_data = WeatherFrame.from_records(weather_data)
+        
+        # Append the forecast array by array instead of copying the record lists
         if forecast_data:
-            all_data.extend(forecast_data)
+            if not isinstance(forecast_data, WeatherFrame):
+                forecast_data = WeatherFrame.from_records(forecast_data)
+            weather_data = WeatherFrame(*(
+                np.concatenate((history, forecast))
+                for history, forecast in zip(weather_data, forecast_data)
+            ))
+        
+        return self.estimate_phenology(weather_data, datetime.now() + timedelta(days=180))
+
+
+def _iter_features(geojson_path: str):
+    """
+    Yield the features of a GeoJSON FeatureCollection.
+    
+    With ijson installed the file is streamed, so only one feature is held in
+    memory at a time; otherwise the whole document is loaded with json.
+    
+    Args:
+        geojson_path: Path to the GeoJSON file
         
-        return self.estimate_phenology(all_data, datetime.now() + timedelta(days=180))
+    Yields:
+        Feature dictionaries in file order
+    """
+    if IJSON_AVAILABLE:
+        with open(geojson_path, 'rb') as f:
+            yield from ijson.items(f, 'features.item', use_float=True)
+    else:
+        with open(geojson_path, 'r') as f:
+            yield from json.load(f)['features']
 
 
-def process_all_fields(geojson_path: str, weather_data: List[Dict]) -> List[Dict]:
+def process_all_fields(geojson_path: str, weather_data: Union[List[Dict], WeatherFrame]) -> List[Dict]:
     """
     Process all fields in the GeoJSON file and estimate phenology for each.
     
     Args:
         geojson_path: Path to the GeoJSON file with field data
-        weather_data: Weather data for the region
+        weather_data: Weather data for the region (records or a WeatherFrame)
         
     Returns:
         List of phenology estimates for each field
     """
-    with open(geojson_path, 'r') as f:
-        data = json.load(f)
+    # All fields share the regional weather series, so convert it only once
+    if not isinstance(weather_data, WeatherFrame):
+        weather_data = WeatherFrame.from_records(weather_data)
+    
+    # With shared weather, phenology depends only on variety and sowing date,
+    # so fields repeating a pair reuse the first estimate
+    current_date = datetime.now()
+    estimates: Dict[Tuple[str, str], Dict] = {}
     
     results = []
     
-    for feature in data['features']:
+    for feature in _iter_features(geojson_path):
         props = feature['properties']
         geom = feature['geometry']
         
         # Get field center coordinates (approximate)
         coords = geom['coordinates'][0]
-        lats = [c[1] for c in coords]
-        lons = [c[0] for c in coords]
-        center_lat = sum(lats) / len(lats)
-        center_lon = sum(lons) / len(lons)
+        center_lon, center_lat = np.asarray(coords, dtype=float)[:, :2].mean(axis=0).tolist()
         
         field_name = props.get('field_name', 'Unknown')
         variety = props.get('wheat_variety', 'Unknown')
@@ -709,14 +864,19 @@ def process_all_fields(geojson_path: str, weather_data: List[Dict]) -> List[Dict
             print(f"Skipping {field_name}: missing sowing date or variety")
             continue
         
-        # Create model and estimate phenology
-        model = WheatPhenologyModel(variety, sowing_date, center_lat)
-        phenology = model.estimate_phenology(weather_data)
+        # Create model and estimate phenology (once per variety/sowing date pair)
+        key = (variety, sowing_date)
+        if key not in estimates:
+            model = WheatPhenologyModel(variety, sowing_date, center_lat)
+            estimates[key] = model.estimate_phenology(weather_data, current_date)
+        phenology = estimates[key]
         
         results.append({
             "field_name": field_name,
             "coordinates": {"lat": center_lat, "lon": center_lon},
-            **phenology
+            **phenology,
+            # Each field gets its own copy so results can be edited independently
+            "stage_dates": dict(phenology["stage_dates"]),
         })
     
     return results
@@ -7,7 +7,62 @@ Values are provided for different growth stages to support yield prediction mode
 RUE is expressed as: g dry matter / MJ absorbed PAR
 """
 
-from typing import Dict
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+# Numba is optional; when installed the biomass kernel is JIT-compiled and runs in parallel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def _biomass_loop(fapar: np.ndarray, par: np.ndarray, days: np.ndarray, lower: np.ndarray,
+                  upper: np.ndarray, rue: np.ndarray, default_rue: float) -> np.ndarray:
+    """
+    Daily biomass with the RUE range lookup fused into one explicit loop (Numba kernel).
+    
+    Args:
+        fapar: Fraction of absorbed PAR (1-D)
+        par: Incident PAR in MJ/m²/day (1-D)
+        days: Days since sowing (1-D)
+        lower: Sorted RUE range starts
+        upper: RUE range ends (exclusive)
+        rue: RUE for each range
+        default_rue: RUE for days outside every range
+        
+    Returns:
+        Daily biomass in g DM/m²/day
+    """
+    out = np.empty(fapar.shape[0])
+    for i in prange(fapar.shape[0]):
+        j = np.searchsorted(lower, days[i], side='right') - 1
+        day_rue = default_rue
+        if j >= 0 and days[i] < upper[j]:
+            day_rue = rue[j]
+        out[i] = fapar[i] * par[i] * day_rue
+    return out
+
+
+def _biomass_numpy(fapar: np.ndarray, par: np.ndarray, days: np.ndarray, lower: np.ndarray,
+                   upper: np.ndarray, rue: np.ndarray, default_rue: float) -> np.ndarray:
+    """Daily biomass with NumPy ufuncs (same result as the loop kernel)."""
+    idx = np.searchsorted(lower, days, side='right') - 1
+    candidate = np.clip(idx, 0, len(rue) - 1)
+    day_rue = np.where((idx >= 0) & (days < upper[candidate]), rue[candidate], default_rue)
+    return fapar * par * day_rue
+
+
+if NUMBA_AVAILABLE:
+    _compute_biomass = njit(cache=True, parallel=True)(_biomass_loop)
+else:
+    _compute_biomass = _biomass_numpy
 
 
 class WheatRUE:
@@ -25,18 +80,20 @@ class WheatRUE:
     RUE_MIN = 2.0  # g DM/MJ PAR (conservative estimate)
     RUE_MAX = 2.8  # g DM/MJ PAR (optimal conditions)
     
+    # RUE tables below are read-only (MappingProxyType) so shared references cannot be mutated
+    
     # RUE by growth stage (based on phenological development)
-    RUE_BY_STAGE = {
+    RUE_BY_STAGE = MappingProxyType({
         'Emergence': 2.0,           # Low efficiency, establishment phase
         'Tillering': 2.4,            # Increasing efficiency
         'Stem Extension': 2.7,       # Peak efficiency
         'Heading/Anthesis': 2.6,     # High efficiency maintained
         'Grain Fill': 2.2,           # Declining efficiency
         'Maturity': 1.8              # Lowest efficiency
-    }
+    })
     
     # RUE by days after sowing (for continuous modeling)
-    RUE_BY_DAYS = {
+    RUE_BY_DAYS = MappingProxyType({
         (0, 20): 2.0,      # Emergence
         (20, 45): 2.4,     # Tillering
         (45, 75): 2.7,     # Stem Extension
@@ -44,10 +101,10 @@ class WheatRUE:
         (105, 125): 2.3,   # Early Grain Fill
         (125, 145): 2.0,   # Late Grain Fill
         (145, 999): 1.8    # Maturity
-    }
+    })
     
     # RUE by Zadoks scale
-    RUE_BY_ZADOKS = {
+    RUE_BY_ZADOKS = MappingProxyType({
         (10, 20): 2.0,     # Emergence
         (20, 29): 2.4,     # Tillering
         (30, 39): 2.7,     # Stem Extension
@@ -55,7 +112,7 @@ class WheatRUE:
         (70, 85): 2.3,     # Early Grain Fill
         (85, 90): 2.0,     # Late Grain Fill
         (90, 92): 1.8      # Maturity
-    }
+    })
     
     @staticmethod
     def get_rue_by_stage(stage: str) -> float:
@@ -68,24 +125,7 @@ class WheatRUE:
         Returns:
             RUE value in g DM/MJ PAR
         """
-        # Handle stage names with Zadoks notation
-        stage_clean = stage.split('(')[0].strip()
-        
-        # Map common variations
-        stage_mappings = {
-            'Stem Extension': 'Stem Extension',
-            'Heading': 'Heading/Anthesis',
-            'Anthesis': 'Heading/Anthesis',
-            'Grain Fill': 'Grain Fill',
-            'Flowering': 'Heading/Anthesis'
-        }
-        
-        for key, value in stage_mappings.items():
-            if key in stage_clean:
-                stage_clean = value
-                break
-        
-        return WheatRUE.RUE_BY_STAGE.get(stage_clean, WheatRUE.AVERAGE_RUE)
+        return _resolve_stage(stage)
     
     @staticmethod
     def get_rue_by_days(days_since_sowing: int) -> float:
@@ -98,11 +138,37 @@ class WheatRUE:
         Returns:
             RUE value in g DM/MJ PAR
         """
-        for (min_days, max_days), rue in WheatRUE.RUE_BY_DAYS.items():
-            if min_days <= days_since_sowing < max_days:
-                return rue
+        return _bisect_range(days_since_sowing, _DAYS_STARTS, _DAYS_RANGES)
+    
+    @staticmethod
+    def get_rue_by_days_array(days_since_sowing: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Get RUE values for many days since sowing at once (vectorized get_rue_by_days).
         
-        return WheatRUE.AVERAGE_RUE
+        Args:
+            days_since_sowing: Days since sowing, a scalar or an array of any shape
+            
+        Returns:
+            RUE values in g DM/MJ PAR with the same shape (a float for a scalar);
+            days outside every range get AVERAGE_RUE
+        """
+        return _lookup_range(days_since_sowing, _DAYS_LOWER, _DAYS_UPPER, _DAYS_RUE)
+    
+    @staticmethod
+    def get_rue_by_zadoks(zadoks: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Get RUE value based on the Zadoks growth stage code.
+        
+        Args:
+            zadoks: Zadoks code, a scalar or an array of any shape
+            
+        Returns:
+            RUE values in g DM/MJ PAR with the same shape (a float for a scalar);
+            codes outside every range get AVERAGE_RUE
+        """
+        if np.ndim(zadoks) == 0:
+            return _bisect_range(zadoks, _ZADOKS_STARTS, _ZADOKS_RANGES)
+        return _lookup_range(zadoks, _ZADOKS_LOWER, _ZADOKS_UPPER, _ZADOKS_RUE)
     
     @staticmethod
     def get_rue_summary() -> Dict:
@@ -117,7 +183,7 @@ class WheatRUE:
             'units': 'g dry matter / MJ absorbed PAR',
             'average_rue': WheatRUE.AVERAGE_RUE,
             'rue_range': (WheatRUE.RUE_MIN, WheatRUE.RUE_MAX),
-            'rue_by_stage': WheatRUE.RUE_BY_STAGE,
+            'rue_by_stage': dict(WheatRUE.RUE_BY_STAGE),
             'source': 'Literature compilation (Sinclair & Muchow 1999, Kiniry et al. 1989)',
             'application': 'For biomass and yield prediction',
             'notes': [
@@ -130,64 +196,201 @@ class WheatRUE:
         }
 
 
+# Common stage name variations, in matching order, with the RUE of the stage they map to
+_STAGE_VARIATIONS = tuple(
+    (variation.casefold(), WheatRUE.RUE_BY_STAGE[stage])
+    for variation, stage in (
+        ('Stem Extension', 'Stem Extension'),
+        ('Heading', 'Heading/Anthesis'),
+        ('Anthesis', 'Heading/Anthesis'),
+        ('Grain Fill', 'Grain Fill'),
+        ('Flowering', 'Heading/Anthesis'),
+    )
+)
+
+# Exact (casefolded) stage names and variations -> RUE
+_STAGE_LOOKUP = {
+    **{stage.casefold(): rue for stage, rue in WheatRUE.RUE_BY_STAGE.items()},
+    **dict(_STAGE_VARIATIONS),
+}
+
+
+@lru_cache(maxsize=256)
+def _resolve_stage(stage: str) -> float:
+    """
+    Resolve a growth stage name to its RUE (cached: callers repeat a few stage names per row).
+    
+    Args:
+        stage: Growth stage name, optionally with Zadoks notation
+        
+    Returns:
+        RUE value in g DM/MJ PAR (AVERAGE_RUE for unknown stages)
+    """
+    # Handle stage names with Zadoks notation (matching ignores case)
+    stage_clean = stage.split('(', 1)[0].strip().casefold()
+    
+    rue = _STAGE_LOOKUP.get(stage_clean)
+    if rue is not None:
+        return rue
+    
+    # Compound names (e.g. 'Early Grain Fill') match the first variation they contain
+    for variation, rue in _STAGE_VARIATIONS:
+        if variation in stage_clean:
+            return rue
+    
+    return WheatRUE.AVERAGE_RUE
+
+
+def _range_arrays(table: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a {(low, high): rue} table into parallel arrays sorted by range start."""
+    items = sorted(table.items())
+    return (
+        np.array([low for (low, _), _ in items]),
+        np.array([high for (_, high), _ in items]),
+        np.array([rue for _, rue in items]),
+    )
+
+
+# Range tables as parallel (start, end, RUE) arrays for binary search
+_DAYS_LOWER, _DAYS_UPPER, _DAYS_RUE = _range_arrays(WheatRUE.RUE_BY_DAYS)
+_ZADOKS_LOWER, _ZADOKS_UPPER, _ZADOKS_RUE = _range_arrays(WheatRUE.RUE_BY_ZADOKS)
+
+# The same tables as sorted ((low, high), rue) tuples plus their range starts, for scalar lookups
+_DAYS_RANGES = tuple(sorted(WheatRUE.RUE_BY_DAYS.items()))
+_DAYS_STARTS = tuple(low for (low, _), _ in _DAYS_RANGES)
+_ZADOKS_RANGES = tuple(sorted(WheatRUE.RUE_BY_ZADOKS.items()))
+_ZADOKS_STARTS = tuple(low for (low, _), _ in _ZADOKS_RANGES)
+
+
+def _bisect_range(value: float, starts: Tuple, ranges: Tuple) -> float:
+    """
+    Look up the RUE of the half-open range [low, high) containing a single value.
+    
+    Args:
+        value: Value to look up
+        starts: Sorted range starts
+        ranges: ((low, high), rue) pairs aligned with starts
+        
+    Returns:
+        RUE value in g DM/MJ PAR (AVERAGE_RUE if the value falls in no range)
+    """
+    i = bisect_right(starts, value) - 1
+    if i >= 0:
+        (_, high), rue = ranges[i]
+        if value < high:
+            return rue
+    return WheatRUE.AVERAGE_RUE
+
+
+def _lookup_range(value, lower: np.ndarray, upper: np.ndarray, rue: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    Look up the RUE of the half-open range [low, high) containing each value.
+    
+    Args:
+        value: Scalar or array of values to look up
+        lower: Sorted range starts
+        upper: Range ends (exclusive), aligned with lower
+        rue: RUE for each range, aligned with lower
+        
+    Returns:
+        RUE values with the shape of value (a float for a scalar); values that
+        fall in no range (including gaps between ranges) get AVERAGE_RUE
+    """
+    value = np.asarray(value)
+    idx = np.searchsorted(lower, value, side='right') - 1
+    candidate = np.clip(idx, 0, len(rue) - 1)
+    in_range = (idx >= 0) & (value < upper[candidate])
+    result = np.where(in_range, rue[candidate], WheatRUE.AVERAGE_RUE)
+    return float(result) if result.ndim == 0 else result
+
+
+def compute_biomass(fapar, par, days_since_sowing) -> np.ndarray:
+    """
+    Calculate daily biomass as fAPAR × PAR × RUE, with RUE taken from RUE_BY_DAYS.
+    
+    Args:
+        fapar: Fraction of absorbed PAR (scalar or array)
+        par: Incident PAR in MJ/m²/day (scalar or array)
+        days_since_sowing: Days since sowing (scalar or array)
+        
+    Returns:
+        Daily biomass in g DM/m²/day, with the broadcast shape of the inputs;
+        days outside every range use AVERAGE_RUE, as in get_rue_by_days
+    """
+    fapar, par, days = np.broadcast_arrays(
+        np.asarray(fapar, dtype=float),
+        np.asarray(par, dtype=float),
+        np.asarray(days_since_sowing, dtype=float)
+    )
+    biomass = _compute_biomass(
+        fapar.ravel(), par.ravel(), days.ravel(),
+        _DAYS_LOWER, _DAYS_UPPER, _DAYS_RUE, WheatRUE.AVERAGE_RUE
+    )
+    return biomass.reshape(fapar.shape)
+
+
+# Report labels for print_rue_summary
+_STAGE_NOTES = MappingProxyType({
+    'Emergence': 'Establishment phase',
+    'Tillering': 'Increasing LAI',
+    'Stem Extension': 'Peak efficiency',
+    'Heading/Anthesis': 'Maximum biomass',
+    'Grain Fill': 'Beginning senescence',
+    'Maturity': 'Minimal growth'
+})
+
+_DAY_STAGE_NAMES = MappingProxyType({
+    (0, 20): 'Emergence',
+    (20, 45): 'Tillering',
+    (45, 75): 'Stem Extension',
+    (75, 105): 'Heading/Anthesis',
+    (105, 125): 'Early Grain Fill',
+    (125, 145): 'Late Grain Fill',
+    (145, 999): 'Maturity'
+})
+
+
 def print_rue_summary():
     """Print a formatted summary of RUE values."""
-    print("=" * 80)
-    print("WHEAT RADIATION USE EFFICIENCY (RUE) VALUES")
-    print("=" * 80)
-    print("\nBased on literature review for wheat crops")
-    print("Units: g dry matter / MJ absorbed PAR")
-    
-    print("\n" + "─" * 80)
-    print("OVERALL VALUES")
-    print("─" * 80)
-    print(f"Average RUE (recommended):  {WheatRUE.AVERAGE_RUE} g DM/MJ PAR")
-    print(f"Range:                       {WheatRUE.RUE_MIN} - {WheatRUE.RUE_MAX} g DM/MJ PAR")
-    
-    print("\n" + "─" * 80)
-    print("RUE BY GROWTH STAGE")
-    print("─" * 80)
-    print(f"{'Growth Stage':25} {'RUE (g DM/MJ PAR)':20} {'Notes':30}")
-    print("─" * 80)
-    
-    stage_notes = {
-        'Emergence': 'Establishment phase',
-        'Tillering': 'Increasing LAI',
-        'Stem Extension': 'Peak efficiency',
-        'Heading/Anthesis': 'Maximum biomass',
-        'Grain Fill': 'Beginning senescence',
-        'Maturity': 'Minimal growth'
-    }
+    # Build the whole report and write it with a single print
+    lines = []
+    lines.append("=" * 80)
+    lines.append("WHEAT RADIATION USE EFFICIENCY (RUE) VALUES")
+    lines.append("=" * 80)
+    lines.append("\nBased on literature review for wheat crops")
+    lines.append("Units: g dry matter / MJ absorbed PAR")
+    
+    lines.append("\n" + "─" * 80)
+    lines.append("OVERALL VALUES")
+    lines.append("─" * 80)
+    lines.append(f"Average RUE (recommended):  {WheatRUE.AVERAGE_RUE} g DM/MJ PAR")
+    lines.append(f"Range:                       {WheatRUE.RUE_MIN} - {WheatRUE.RUE_MAX} g DM/MJ PAR")
+    
+    lines.append("\n" + "─" * 80)
+    lines.append("RUE BY GROWTH STAGE")
+    lines.append("─" * 80)
+    lines.append(f"{'Growth Stage':25} {'RUE (g DM/MJ PAR)':20} {'Notes':30}")
+    lines.append("─" * 80)
     
     for stage, rue in WheatRUE.RUE_BY_STAGE.items():
-        note = stage_notes.get(stage, '')
-        print(f"{stage:25} {rue:20.1f} {note:30}")
-    
-    print("\n" + "─" * 80)
-    print("RUE BY DAYS AFTER SOWING")
-    print("─" * 80)
-    print(f"{'Days Range':20} {'RUE (g DM/MJ PAR)':20} {'Growth Stage':25}")
-    print("─" * 80)
-    
-    day_stages = {
-        (0, 20): 'Emergence',
-        (20, 45): 'Tillering',
-        (45, 75): 'Stem Extension',
-        (75, 105): 'Heading/Anthesis',
-        (105, 125): 'Early Grain Fill',
-        (125, 145): 'Late Grain Fill',
-        (145, 999): 'Maturity'
-    }
+        note = _STAGE_NOTES.get(stage, '')
+        lines.append(f"{stage:25} {rue:20.1f} {note:30}")
+    
+    lines.append("\n" + "─" * 80)
+    lines.append("RUE BY DAYS AFTER SOWING")
+    lines.append("─" * 80)
+    lines.append(f"{'Days Range':20} {'RUE (g DM/MJ PAR)':20} {'Growth Stage':25}")
+    lines.append("─" * 80)
     
     for days, rue in WheatRUE.RUE_BY_DAYS.items():
-        stage = day_stages[days]
+        stage = _DAY_STAGE_NAMES[days]
         day_range = f"{days[0]}-{days[1] if days[1] < 999 else '145+'}"
-        print(f"{day_range:20} {rue:20.1f} {stage:25}")
+        lines.append(f"{day_range:20} {rue:20.1f} {stage:25}")
     
-    print("\n" + "=" * 80)
-    print("APPLICATION NOTES")
-    print("=" * 80)
-    print("""
+    lines.append("\n" + "=" * 80)
+    lines.append("APPLICATION NOTES")
+    lines.append("=" * 80)
+    lines.append("""
 These RUE values can be used for:
 
 1. Biomass Estimation:
@@ -212,33 +415,36 @@ References:
 - Kiniry et al. (1989): RUE in grain crops
 - Kemanian et al. (2004): Wheat RUE estimation
     """)
+    
+    print("\n".join(lines))
 
 
 def example_usage():
     """Show example usage of RUE functions."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE USAGE")
-    print("=" * 80)
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("EXAMPLE USAGE")
+    lines.append("=" * 80)
     
     # Example 1: Get RUE by stage
-    print("\nExample 1: Get RUE by growth stage")
-    print("─" * 80)
+    lines.append("\nExample 1: Get RUE by growth stage")
+    lines.append("─" * 80)
     stage = "Stem Extension (Zadoks 30)"
     rue = WheatRUE.get_rue_by_stage(stage)
-    print(f"Growth Stage: {stage}")
-    print(f"RUE: {rue} g DM/MJ PAR")
+    lines.append(f"Growth Stage: {stage}")
+    lines.append(f"RUE: {rue} g DM/MJ PAR")
     
     # Example 2: Get RUE by days
-    print("\nExample 2: Get RUE by days since sowing")
-    print("─" * 80)
+    lines.append("\nExample 2: Get RUE by days since sowing")
+    lines.append("─" * 80)
     days = 80
     rue = WheatRUE.get_rue_by_days(days)
-    print(f"Days since sowing: {days}")
-    print(f"RUE: {rue} g DM/MJ PAR")
+    lines.append(f"Days since sowing: {days}")
+    lines.append(f"RUE: {rue} g DM/MJ PAR")
     
     # Example 3: Calculate biomass
-    print("\nExample 3: Calculate daily biomass accumulation")
-    print("─" * 80)
+    lines.append("\nExample 3: Calculate daily biomass accumulation")
+    lines.append("─" * 80)
     fapar = 0.75  # from NDVI
     par_incident = 10.0  # MJ/m²/day
     rue = 2.6  # g DM/MJ PAR
@@ -246,12 +452,14 @@ def example_usage():
     apar = fapar * par_incident  # absorbed PAR
     daily_biomass = apar * rue
     
-    print(f"fAPAR: {fapar}")
-    print(f"Incident PAR: {par_incident} MJ/m²/day")
-    print(f"RUE: {rue} g DM/MJ PAR")
-    print(f"Absorbed PAR: {apar} MJ/m²/day")
-    print(f"Daily Biomass: {daily_biomass} g DM/m²/day")
-    print(f"              = {daily_biomass * 10} kg DM/ha/day")
+    lines.append(f"fAPAR: {fapar}")
+    lines.append(f"Incident PAR: {par_incident} MJ/m²/day")
+    lines.append(f"RUE: {rue} g DM/MJ PAR")
+    lines.append(f"Absorbed PAR: {apar} MJ/m²/day")
+    lines.append(f"Daily Biomass: {daily_biomass} g DM/m²/day")
+    lines.append(f"              = {daily_biomass * 10} kg DM/ha/day")
+    
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":